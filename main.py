@@ -17,7 +17,9 @@ Browser Agent - AI-агент для автоматизации браузера
 
 import asyncio
 import sys
+import queue
 import logging
+import logging.handlers
 from pathlib import Path
 
 # Добавляем корневую директорию в путь
@@ -27,33 +29,67 @@ sys.path.insert(0, str(ROOT_DIR))
 from src.ui.cli import CLI
 
 
+# Listener, запущенный setup_logging (None - логирование ещё не настроено)
+_log_listener: "logging.handlers.QueueListener | None" = None
+
+
 # Настройка логирования
-def setup_logging(level: str = "INFO") -> None:
-    """Настраивает логирование."""
+def setup_logging(level: str = "INFO") -> logging.handlers.QueueListener:
+    """
+    Настраивает логирование.
+    
+    Корневой логгер пишет записи в очередь (QueueHandler), а вывод в
+    stdout выполняет QueueListener в отдельном потоке - вызовы logger.*
+    из async-цикла агента не блокируются на I/O.
+    
+    Повторный вызов только меняет уровень и возвращает уже запущенный
+    listener, не добавляя второй QueueHandler (иначе каждая запись
+    выводилась бы дважды).
+    
+    Returns:
+        QueueListener: Запущенный listener (остановить при выходе)
+    """
+    global _log_listener
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, level.upper()))
+    
+    if _log_listener is not None:
+        return _log_listener
+    
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(log_format))
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
     )
+    listener.start()
+    _log_listener = listener
     
     # Уменьшаем шум от библиотек
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("playwright").setLevel(logging.WARNING)
+    
+    return listener
 
 
 async def main() -> None:
     """Точка входа в приложение."""
     # Настраиваем логирование (можно изменить на DEBUG для отладки)
-    setup_logging("WARNING")
+    listener = setup_logging("WARNING")
     
     # Запускаем CLI
-    cli = CLI()
-    await cli.run()
+    try:
+        cli = CLI()
+        await cli.run()
+    finally:
+        listener.stop()
 
 
 def run() -> None:
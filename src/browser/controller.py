@@ -100,7 +100,8 @@ class BrowserController:
         Запускает браузер в видимом режиме.
         
         Создаёт persistent context для сохранения сессий
-        между запусками.
+        между запусками. Если задан BROWSER_WS_ENDPOINT, вместо
+        запуска подключается к уже работающему браузеру по CDP.
         
         Returns:
             Page: Активная страница браузера
@@ -113,52 +114,15 @@ class BrowserController:
             
             self._playwright = await async_playwright().start()
             
-            # Выбираем тип браузера
-            browser_type = getattr(
-                self._playwright,
-                self.config.browser_type,
-                self._playwright.chromium
-            )
-            
-            # Создаём директорию для данных пользователя
-            user_data_dir = Path(self.config.user_data_dir)
-            user_data_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Browser args to enable extensions and hide automation
-            browser_args = [
-                "--disable-blink-features=AutomationControlled",  # Hide automation detection
-                "--enable-extensions",  # Enable extensions
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-infobars",  # Hide "Chrome is being controlled by automated test software"
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--log-level=3",  # Suppress console warnings (0=INFO, 1=WARNING, 2=LOG, 3=ERROR only)
-                "--silent-debugger-extension-api",  # Suppress debugger extension warnings
-            ]
-            
-            # Flags to remove from default Playwright args (they block extensions)
-            ignore_default_args = [
-                "--enable-automation",  # Removes automation detection
-                "--disable-extensions",  # We want extensions enabled
-                "--disable-component-extensions-with-background-pages",  # Allow extension background pages
-            ]
-            
-            # Запускаем persistent context для сохранения сессий
-            self._context = await browser_type.launch_persistent_context(
-                user_data_dir=str(user_data_dir),
-                headless=self.config.headless,
-                viewport={
-                    "width": self.config.viewport_width,
-                    "height": self.config.viewport_height
-                },
-                slow_mo=self.config.slow_mo,
-                args=browser_args,
-                ignore_default_args=ignore_default_args,
-            )
+            if self.config.cdp_endpoint:
+                # Переиспользуем уже запущенный браузер (сессии и cookies)
+                self._context = await self._connect_over_cdp(self.config.cdp_endpoint)
+            else:
+                self._context = await self._launch_persistent_context()
             
-            # Получаем или создаём страницу
-            if self._context.pages:
+            # Получаем или создаём страницу. В подключённом по CDP браузере
+            # открываем свою вкладку, не трогая вкладки пользователя
+            if self._context.pages and not self.config.cdp_endpoint:
                 self._page = self._context.pages[0]
             else:
                 self._page = await self._context.new_page()
@@ -211,6 +175,89 @@ class BrowserController:
             logger.error(f"Ошибка запуска браузера: {e}")
             raise BrowserError(f"Не удалось запустить браузер: {e}") from e
     
+    async def _launch_persistent_context(self) -> BrowserContext:
+        """
+        Запускает новый браузер с persistent context.
+        
+        Returns:
+            BrowserContext: Контекст с данными из user_data_dir
+        """
+        # Выбираем тип браузера
+        browser_type = getattr(
+            self._playwright,
+            self.config.browser_type,
+            self._playwright.chromium
+        )
+        
+        # Создаём директорию для данных пользователя
+        user_data_dir = Path(self.config.user_data_dir)
+        user_data_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Browser args to enable extensions and hide automation
+        browser_args = [
+            "--disable-blink-features=AutomationControlled",  # Hide automation detection
+            "--enable-extensions",  # Enable extensions
+            "--no-sandbox",
+            "--disable-setuid-sandbox",
+            "--disable-infobars",  # Hide "Chrome is being controlled by automated test software"
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--log-level=3",  # Suppress console warnings (0=INFO, 1=WARNING, 2=LOG, 3=ERROR only)
+            "--silent-debugger-extension-api",  # Suppress debugger extension warnings
+        ]
+        
+        # Flags to remove from default Playwright args (they block extensions)
+        ignore_default_args = [
+            "--enable-automation",  # Removes automation detection
+            "--disable-extensions",  # We want extensions enabled
+            "--disable-component-extensions-with-background-pages",  # Allow extension background pages
+        ]
+        
+        # Запускаем persistent context для сохранения сессий
+        return await browser_type.launch_persistent_context(
+            user_data_dir=str(user_data_dir),
+            headless=self.config.headless,
+            viewport={
+                "width": self.config.viewport_width,
+                "height": self.config.viewport_height
+            },
+            slow_mo=self.config.slow_mo,
+            args=browser_args,
+            ignore_default_args=ignore_default_args,
+        )
+    
+    async def _connect_over_cdp(self, endpoint: str) -> BrowserContext:
+        """
+        Подключается к уже запущенному Chromium по CDP.
+        
+        Браузер запускается отдельно с --remote-debugging-port и живёт
+        между запусками агента: не тратим время на старт и не теряем
+        авторизацию на сайтах.
+        
+        Args:
+            endpoint: HTTP или WebSocket адрес CDP (например http://localhost:9222)
+            
+        Returns:
+            BrowserContext: Основной контекст подключённого браузера
+        """
+        logger.info("Подключение к браузеру по CDP: %s", endpoint)
+        
+        self._browser = await self._playwright.chromium.connect_over_cdp(
+            endpoint,
+            slow_mo=self.config.slow_mo,
+        )
+        
+        # Основной контекст браузера хранит его cookies и вкладки
+        if self._browser.contexts:
+            return self._browser.contexts[0]
+        
+        return await self._browser.new_context(
+            viewport={
+                "width": self.config.viewport_width,
+                "height": self.config.viewport_height
+            }
+        )
+    
     async def _human_delay(
         self,
         min_ms: int = 100,
@@ -910,7 +957,14 @@ class BrowserController:
         logger.info("Закрытие браузера")
         
         try:
-            if self._context:
+            if self._browser:
+                # Подключение по CDP: только отключаемся, внешний браузер
+                # продолжает работать
+                await self._browser.close()
+                self._browser = None
+                self._context = None
+                self._page = None
+            elif self._context:
                 await self._context.close()
                 self._context = None
                 self._page = None
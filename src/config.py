@@ -71,6 +71,10 @@ class BrowserConfig:
     
     # Таймаут навигации (мс) - оптимизирован для быстрой загрузки
     navigation_timeout: int = 5000  # Reduced from 60000 (83% faster)
+    
+    # CDP endpoint уже запущенного Chromium (например http://localhost:9222).
+    # Если задан - подключаемся к нему вместо запуска нового браузера
+    cdp_endpoint: Optional[str] = None
 
 
 @dataclass
@@ -135,6 +139,7 @@ class Config:
             slow_mo=int(os.getenv("SLOW_MO", "10")),
             default_timeout=int(os.getenv("DEFAULT_TIMEOUT", "3000")),
             navigation_timeout=int(os.getenv("NAVIGATION_TIMEOUT", "5000")),
+            cdp_endpoint=os.getenv("BROWSER_WS_ENDPOINT") or None,
         )
         
         # Vision config for screenshot-based AI mode
@@ -12,9 +12,10 @@ BrowserAgent - главный класс AI-агента для браузерн
 
 import logging
 import asyncio
+import sys
 import time
 import json
-from typing import Optional, Dict, Any, List, Callable, Awaitable, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable, TYPE_CHECKING
 
 from ..browser.controller import BrowserController, BrowserError
 from ..browser.page_analyzer import PageAnalyzer
@@ -34,6 +35,34 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Форматтеры compact-лога: строится только сообщение для вызванного
+# инструмента, а не весь набор строк на каждый вызов
+_COMPACT_LOG_FORMATS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "navigate": lambda p: f"● Переход на {p.get('url', '')}",
+    "click": lambda p: f"● Клик на элемент {p.get('element_index', p.get('selector', ''))}",
+    "click_at_coordinates": lambda p: f"● Клик по координатам ({p.get('x', 0)}, {p.get('y', 0)})",
+    "type_text": lambda p: f"● Ввод текста: \"{p.get('text', '')}\"",
+    "select_option": lambda p: f"● Выбор опции: {p.get('value', '')}",
+    "scroll": lambda p: f"● Прокрутка {p.get('direction', 'down')}",
+    "wait": lambda p: f"● Пауза {p.get('timeout', 0)}ms",
+    "extract_data": lambda p: "● Извлечение данных",
+    "go_back": lambda p: "● Назад",
+    "refresh": lambda p: "● Обновление страницы",
+    "take_screenshot": lambda p: "● Скриншот",
+    "complete_task": lambda p: f"● Завершение: {p.get('summary', '')[:50]}",
+    "ask_user": lambda p: f"● Вопрос пользователю: {p.get('question', '')[:50]}",
+}
+
+# Ключевые слова задач на извлечение данных и "пустые" фразы в результате
+# complete_task (для автоматической подстановки извлечённых данных)
+_EXTRACTION_KEYWORDS: Tuple[str, ...] = (
+    "извлеч", "прочита", "расскаж", "покаж", "найди", "список", "письм",
+)
+_GENERIC_PHRASES: Tuple[str, ...] = (
+    "проанализиро", "извлечены данные", "извлечено", "данные получены", "информация получена",
+)
+
+
 class AgentError(Exception):
     """Базовое исключение для ошибок агента."""
     pass
@@ -191,7 +220,8 @@ class BrowserAgent:
         await self.browser_controller.launch()
         self._is_started = True
         
-        await self._notify_status("Агент запущен")
+        if self._on_status:
+            await self._notify_status("Агент запущен")
         logger.info("Агент успешно запущен")
     
     async def stop(self) -> None:
@@ -203,11 +233,19 @@ class BrowserAgent:
         
         logger.info("Остановка агента...")
         
-        await self.browser_controller.close()
-        await self.llm_client.close()
+        # Браузер и HTTP-клиент LLM независимы - закрываем их параллельно
+        results = await asyncio.gather(
+            self.browser_controller.close(),
+            self.llm_client.close(),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         
         self._is_started = False
-        await self._notify_status("Агент остановлен")
+        if self._on_status:
+            await self._notify_status("Агент остановлен")
         
         # Выводим итоговую статистику токенов
         if self._total_input_tokens > 0 or self._total_output_tokens > 0:
@@ -279,7 +317,8 @@ class BrowserAgent:
         self._actions_taken = []
         self._last_clicked_text = ""
         
-        await self._notify_status(f"Начало задачи: {task[:50]}...")
+        if self._on_status:
+            await self._notify_status(f"Начало задачи: {task[:50]}...")
         
         # Инициализируем историю сообщений с SLIDING WINDOW для экономии токенов
         MAX_MESSAGE_HISTORY = Limits.MAX_MESSAGE_HISTORY
@@ -765,7 +804,8 @@ class BrowserAgent:
                     "message": f"Действие отклонено: {reason}"
                 }
         
-        await self._notify_action(tool_name, tool_input)
+        if self._on_action:
+            await self._notify_action(tool_name, tool_input)
         
         try:
             result = await self._execute_tool_impl(tool_name, tool_input)
@@ -1573,7 +1613,8 @@ class BrowserAgent:
             str | None: Ответ пользователя или None
         """
         logger.info(f"❓ Вопрос пользователю: {question}")
-        await self._notify_status(f"Ожидание ответа: {question[:50]}...")
+        if self._on_status:
+            await self._notify_status(f"Ожидание ответа: {question[:50]}...")
         
         # Если есть callback - используем его
         if hasattr(self, '_user_response_callback') and self._user_response_callback:
@@ -1587,7 +1628,6 @@ class BrowserAgent:
         
         # Если callback нет - используем input() в отдельном потоке (для CLI)
         try:
-            import sys
             if sys.stdin.isatty():
                 # Консольный режим - читаем из stdin
                 print(f"\n{'='*50}")
@@ -1625,15 +1665,14 @@ class BrowserAgent:
         # AUTOMATIC DATA CAPTURE: Check if we need to use stored extracted data
         # This prevents data loss when LLM forgets to include data in complete_task
         original_task = self.task_manager.current_task.description.lower() if self.task_manager.current_task else ""
-        extraction_keywords = ["извлеч", "прочита", "расскаж", "покаж", "найди", "список", "письм"]
-        is_extraction_task = any(keyword in original_task for keyword in extraction_keywords)
+        is_extraction_task = any(keyword in original_task for keyword in _EXTRACTION_KEYWORDS)
         
         # If this is an extraction task, check if result is missing or too generic
         if is_extraction_task:
-            generic_phrases = ["проанализиро", "извлечены данные", "извлечено", "данные получены", "информация получена"]
             result_is_empty = not result_data or len(result_data.strip()) == 0
             result_is_too_short = result_data and len(result_data) < 50
-            result_is_generic = result_data and any(phrase in result_data.lower() for phrase in generic_phrases)
+            result_lower = result_data.lower() if result_data else ""
+            result_is_generic = result_data and any(phrase in result_lower for phrase in _GENERIC_PHRASES)
             
             # Automatically use stored extracted data if result is problematic
             if (result_is_empty or result_is_too_short or result_is_generic) and self._extracted_data:
@@ -1710,40 +1749,37 @@ class BrowserAgent:
             tool_input: Параметры инструмента
             result: Результат выполнения
         """
-        action_map = {
-            "navigate": f"● Переход на {tool_input.get('url', '')}",
-            "click": f"● Клик на элемент {tool_input.get('element_index', tool_input.get('selector', ''))}",
-            "click_at_coordinates": f"● Клик по координатам ({tool_input.get('x', 0)}, {tool_input.get('y', 0)})",
-            "type_text": f"● Ввод текста: \"{tool_input.get('text', '')}\"",
-            "select_option": f"● Выбор опции: {tool_input.get('value', '')}",
-            "scroll": f"● Прокрутка {tool_input.get('direction', 'down')}",
-            "wait": f"● Пауза {tool_input.get('timeout', 0)}ms",
-            "extract_data": f"● Извлечение данных",
-            "go_back": "● Назад",
-            "refresh": "● Обновление страницы",
-            "take_screenshot": "● Скриншот",
-            "complete_task": f"● Завершение: {tool_input.get('summary', '')[:50]}",
-            "ask_user": f"● Вопрос пользователю: {tool_input.get('question', '')[:50]}",
-        }
-        
-        message = action_map.get(tool_name, f"● {tool_name}")
-        print(message)
+        formatter = _COMPACT_LOG_FORMATS.get(tool_name)
+        message = formatter(tool_input) if formatter else f"● {tool_name}"
+        sys.stdout.write(message + "\n")
     
     async def _notify_action(self, action: str, params: Dict) -> None:
-        """Уведомляет о выполняемом действии."""
-        if self._on_action:
-            try:
-                await self._on_action(action, params)
-            except Exception as e:
-                logger.warning(f"Ошибка callback on_action: {e}")
+        """
+        Уведомляет о выполняемом действии.
+        
+        Вызывающий код проверяет self._on_action до await, чтобы не
+        создавать корутину, когда callback не установлен (CLI без UI).
+        Проверка здесь защищает от вызова без такой проверки.
+        """
+        if not self._on_action:
+            return
+        try:
+            await self._on_action(action, params)
+        except Exception as e:
+            logger.warning(f"Ошибка callback on_action: {e}")
     
     async def _notify_status(self, status: str) -> None:
-        """Уведомляет об изменении статуса."""
-        if self._on_status:
-            try:
-                await self._on_status(status)
-            except Exception as e:
-                logger.warning(f"Ошибка callback on_status: {e}")
+        """
+        Уведомляет об изменении статуса.
+        
+        Вызывающий код проверяет self._on_status до await.
+        """
+        if not self._on_status:
+            return
+        try:
+            await self._on_status(status)
+        except Exception as e:
+            logger.warning(f"Ошибка callback on_status: {e}")
     
     async def __aenter__(self) -> "BrowserAgent":
         """Поддержка async context manager."""
@@ -259,11 +259,13 @@ class ContextManager:
         """
         Очищает всю историю.
         
-        Используется при начале новой задачи.
+        Используется при начале новой задачи. Контейнеры пересоздаются,
+        а не очищаются поэлементно: старые списки (включая снимки страниц)
+        освобождаются целиком, когда на них не остаётся ссылок.
         """
-        self._action_history.clear()
-        self._page_state_history.clear()
-        self._messages.clear()
+        self._action_history = []
+        self._page_state_history = []
+        self._messages = []
         logger.debug("История очищена")
     
     def clear_messages(self) -> None:
@@ -282,17 +284,14 @@ class ContextManager:
         Returns:
             Dict: Сводка с информацией о контексте
         """
+        last_action = self._action_history[-1] if self._action_history else None
+        last_error = self.get_last_error()
+        
         return {
             "actions_count": len(self._action_history),
             "messages_count": len(self._messages),
             "page_states_count": len(self._page_state_history),
             "success_rate": self.get_success_rate(),
-            "last_action": (
-                self._action_history[-1].to_summary() 
-                if self._action_history else None
-            ),
-            "last_error": (
-                self.get_last_error().error 
-                if self.get_last_error() else None
-            )
+            "last_action": last_action.to_summary() if last_action else None,
+            "last_error": last_error.error if last_error else None
         }
\ No newline at end of file
@@ -8,7 +8,9 @@ TaskManager - управление задачами агента.
 """
 
 import logging
-from typing import Optional, List
+import time
+from collections import deque
+from typing import Optional, Deque, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -37,7 +39,11 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Строковые значения статусов (без обращения к Enum.value в get_stats)
+_STATUS_VALUE_CACHE = {status: status.value for status in TaskStatus}
+
+
+@dataclass(slots=True)
 class TaskResult:
     """
     Результат выполнения задачи.
@@ -60,11 +66,14 @@ class TaskResult:
     duration_seconds: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Task:
     """
     Представляет задачу агента.
     
+    Задачи сравниваются по идентичности (eq=False): у задачи есть
+    уникальный id, а поэлементное сравнение всех полей не нужно.
+    
     Attributes:
         id: Уникальный идентификатор задачи
         description: Описание задачи от пользователя
@@ -74,6 +83,8 @@ class Task:
         completed_at: Время завершения
         result: Результат выполнения
         pending_question: Вопрос к пользователю (если status == WAITING_INPUT)
+        started_monotonic: time.monotonic() на старте (для длительности)
+        completed_monotonic: time.monotonic() при завершении
     """
     id: str
     description: str
@@ -83,19 +94,26 @@ class Task:
     completed_at: Optional[datetime] = None
     result: Optional[TaskResult] = None
     pending_question: Optional[str] = None
+    started_monotonic: Optional[float] = None
+    completed_monotonic: Optional[float] = None
     
     def get_duration(self) -> float:
         """
         Возвращает длительность выполнения задачи.
         
+        Считается по монотонным часам; started_at/completed_at
+        остаются для отображения и логов.
+        
         Returns:
             float: Длительность в секундах
         """
-        if not self.started_at:
+        if self.started_monotonic is None:
             return 0.0
         
-        end_time = self.completed_at or datetime.now()
-        return (end_time - self.started_at).total_seconds()
+        end_time = self.completed_monotonic
+        if end_time is None:
+            end_time = time.monotonic()
+        return end_time - self.started_monotonic
 
 
 class TaskManager:
@@ -124,19 +142,49 @@ class TaskManager:
         ```
     """
     
-    def __init__(self, max_iterations: int = 50):
+    __slots__ = (
+        "max_iterations",
+        "_current_task",
+        "_task_history",
+        "_iteration_count",
+        "_task_counter",
+        "_completed_count",
+        "_failed_count",
+        "_cancelled_count",
+        "_cached_status_value",
+    )
+    
+    # Статусы, после которых задача считается завершённой
+    _TERMINAL_STATUSES = frozenset({
+        TaskStatus.COMPLETED,
+        TaskStatus.FAILED,
+        TaskStatus.CANCELLED,
+    })
+    
+    def __init__(self, max_iterations: int = 50, history_maxlen: int = 1000):
         """
         Инициализирует менеджер задач.
         
         Args:
             max_iterations: Максимальное количество итераций
+            history_maxlen: Максимальное количество задач в истории
+                (старые вытесняются, но учитываются в статистике)
         """
         self.max_iterations = max_iterations
         self._current_task: Optional[Task] = None
-        self._task_history: List[Task] = []
+        self._task_history: Deque[Task] = deque(maxlen=history_maxlen)
         self._iteration_count: int = 0
         self._task_counter: int = 0
         
+        # Счётчики завершённых задач за всё время (get_stats без обхода
+        # истории; учитывают и задачи, вытесненные из _task_history)
+        self._completed_count: int = 0
+        self._failed_count: int = 0
+        self._cancelled_count: int = 0
+        
+        # Строковый статус текущей задачи, обновляется при переходах
+        self._cached_status_value: str = _STATUS_VALUE_CACHE[TaskStatus.IDLE]
+        
         logger.debug(f"TaskManager инициализирован: max_iterations={max_iterations}")
     
     @property
@@ -154,27 +202,28 @@ class TaskManager:
     @property
     def is_running(self) -> bool:
         """Проверяет, выполняется ли задача."""
-        return self.status == TaskStatus.RUNNING
+        return self.status is TaskStatus.RUNNING
     
     @property
     def is_waiting_input(self) -> bool:
         """Проверяет, ожидается ли ввод пользователя."""
-        return self.status == TaskStatus.WAITING_INPUT
+        return self.status is TaskStatus.WAITING_INPUT
     
     @property
     def is_complete(self) -> bool:
         """Проверяет, завершена ли задача."""
-        return self.status in (
-            TaskStatus.COMPLETED, 
-            TaskStatus.FAILED, 
-            TaskStatus.CANCELLED
-        )
+        return self.status in self._TERMINAL_STATUSES
     
     @property
     def iteration_count(self) -> int:
         """Возвращает количество итераций текущей задачи."""
         return self._iteration_count
     
+    def _set_status(self, status: TaskStatus) -> None:
+        """Меняет статус текущей задачи и кэшированное строковое значение."""
+        self._current_task.status = status
+        self._cached_status_value = _STATUS_VALUE_CACHE[status]
+    
     def set_task(self, description: str) -> Task:
         """
         Устанавливает новую задачу.
@@ -194,7 +243,7 @@ class TaskManager:
             )
         
         self._task_counter += 1
-        task_id = f"task_{self._task_counter}_{datetime.now().strftime('%H%M%S')}"
+        task_id = f"task_{self._task_counter}_{time.strftime('%H%M%S')}"
         
         task = Task(
             id=task_id,
@@ -203,9 +252,11 @@ class TaskManager:
         )
         
         self._current_task = task
+        self._cached_status_value = _STATUS_VALUE_CACHE[TaskStatus.IDLE]
         self._iteration_count = 0
         
-        logger.info(f"Создана задача: {task_id} - {description[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Создана задача: %s - %s...", task_id, description[:50])
         return task
     
     def start(self) -> None:
@@ -218,10 +269,11 @@ class TaskManager:
         if not self._current_task:
             raise RuntimeError("Нет задачи для выполнения")
         
-        self._current_task.status = TaskStatus.RUNNING
+        self._set_status(TaskStatus.RUNNING)
         self._current_task.started_at = datetime.now()
+        self._current_task.started_monotonic = time.monotonic()
         
-        logger.info(f"Задача начата: {self._current_task.id}")
+        logger.info("Задача начата: %s", self._current_task.id)
     
     def increment_iteration(self) -> bool:
         """
@@ -257,8 +309,9 @@ class TaskManager:
         if not self._current_task:
             raise RuntimeError("Нет активной задачи")
         
-        self._current_task.status = TaskStatus.COMPLETED
+        self._set_status(TaskStatus.COMPLETED)
         self._current_task.completed_at = datetime.now()
+        self._current_task.completed_monotonic = time.monotonic()
         
         result = TaskResult(
             success=True,
@@ -270,11 +323,13 @@ class TaskManager:
         )
         
         self._current_task.result = result
+        self._completed_count += 1
         self._task_history.append(self._current_task)
         
-        logger.info(
-            f"Задача завершена: {self._current_task.id} - {summary[:50]}..."
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Задача завершена: %s - %s...", self._current_task.id, summary[:50]
+            )
         
         return result
     
@@ -294,8 +349,9 @@ class TaskManager:
         if not self._current_task:
             raise RuntimeError("Нет активной задачи")
         
-        self._current_task.status = TaskStatus.FAILED
+        self._set_status(TaskStatus.FAILED)
         self._current_task.completed_at = datetime.now()
+        self._current_task.completed_monotonic = time.monotonic()
         
         result = TaskResult(
             success=False,
@@ -307,9 +363,10 @@ class TaskManager:
         )
         
         self._current_task.result = result
+        self._failed_count += 1
         self._task_history.append(self._current_task)
         
-        logger.warning(f"Задача не удалась: {self._current_task.id} - {reason}")
+        logger.warning("Задача не удалась: %s - %s", self._current_task.id, reason)
         
         return result
     
@@ -323,8 +380,9 @@ class TaskManager:
         if not self._current_task:
             raise RuntimeError("Нет активной задачи")
         
-        self._current_task.status = TaskStatus.CANCELLED
+        self._set_status(TaskStatus.CANCELLED)
         self._current_task.completed_at = datetime.now()
+        self._current_task.completed_monotonic = time.monotonic()
         
         result = TaskResult(
             success=False,
@@ -335,9 +393,10 @@ class TaskManager:
         )
         
         self._current_task.result = result
+        self._cancelled_count += 1
         self._task_history.append(self._current_task)
         
-        logger.info(f"Задача отменена: {self._current_task.id}")
+        logger.info("Задача отменена: %s", self._current_task.id)
         
         return result
     
@@ -351,7 +410,7 @@ class TaskManager:
         if not self._current_task:
             raise RuntimeError("Нет активной задачи")
         
-        self._current_task.status = TaskStatus.WAITING_INPUT
+        self._set_status(TaskStatus.WAITING_INPUT)
         self._current_task.pending_question = question
         
         logger.info(f"Ожидание ввода: {question[:50]}...")
@@ -369,10 +428,10 @@ class TaskManager:
         if not self._current_task:
             raise RuntimeError("Нет активной задачи")
         
-        if self._current_task.status != TaskStatus.WAITING_INPUT:
+        if self._current_task.status is not TaskStatus.WAITING_INPUT:
             raise RuntimeError("Задача не ожидает ввода")
         
-        self._current_task.status = TaskStatus.RUNNING
+        self._set_status(TaskStatus.RUNNING)
         self._current_task.pending_question = None
         
         logger.info(f"Получен ввод пользователя: {user_input[:50]}...")
@@ -401,14 +460,25 @@ class TaskManager:
             return self._current_task.pending_question
         return None
     
-    def get_task_history(self) -> List[Task]:
+    def get_task_history(self) -> Sequence[Task]:
+        """
+        Возвращает снимок истории выполненных задач.
+        
+        Returns:
+            Sequence[Task]: Кортеж задач (неизменяемый снимок)
+        """
+        return tuple(self._task_history)
+    
+    def iter_task_history(self) -> Iterator[Task]:
         """
-        Возвращает историю выполненных задач.
+        Итерирует историю задач без создания копии.
+        
+        Для read-only обхода; историю нельзя изменять во время итерации.
         
         Returns:
-            List[Task]: Список задач
+            Iterator[Task]: Итератор по задачам
         """
-        return self._task_history.copy()
+        return iter(self._task_history)
     
     def get_stats(self) -> dict:
         """
@@ -417,20 +487,14 @@ class TaskManager:
         Returns:
             dict: Статистика
         """
-        completed = sum(
-            1 for t in self._task_history 
-            if t.status == TaskStatus.COMPLETED
-        )
-        failed = sum(
-            1 for t in self._task_history 
-            if t.status == TaskStatus.FAILED
-        )
+        completed = self._completed_count
+        total = completed + self._failed_count + self._cancelled_count
         
         return {
-            "total_tasks": len(self._task_history),
+            "total_tasks": total,
             "completed": completed,
-            "failed": failed,
-            "success_rate": completed / len(self._task_history) if self._task_history else 0.0,
-            "current_status": self.status.value,
+            "failed": self._failed_count,
+            "success_rate": completed / total if total else 0.0,
+            "current_status": self._cached_status_value,
             "current_iterations": self._iteration_count
         }
\ No newline at end of file
@@ -6,11 +6,15 @@ SecurityLayer - слой безопасности для Browser Agent.
 """
 
 import re
+import asyncio
 import logging
 from typing import Optional, Dict, Any, Callable, Awaitable, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Ответы, означающие согласие в консольном подтверждении
+_CONFIRM_ANSWERS = frozenset({"yes", "y", "да", "д", "1"})
+
 
 class SecurityLayer:
     """
@@ -40,6 +44,8 @@ class SecurityLayer:
         ```
     """
     
+    __slots__ = ("_confirmation_callback", "_skip_confirmations", "_tool_dispatch")
+    
     # Паттерны опасных действий
     DANGEROUS_PATTERNS = {
         "payment": [
@@ -64,11 +70,25 @@ class SecurityLayer:
         ]
     }
     
+    # Паттерны, скомпилированные по категориям: один проход regex на
+    # категорию вместо проверки каждой подстроки по отдельности
+    _DANGEROUS_PATTERN_RES = {
+        category: re.compile("|".join(re.escape(p.lower()) for p in patterns))
+        for category, patterns in DANGEROUS_PATTERNS.items()
+    }
+    
     # URL паттерны высокого риска
     DANGEROUS_URL_PATTERNS = [
         r"checkout", r"payment", r"pay\.", r"order", r"cart",
         r"billing", r"subscribe", r"premium"
     ]
+    _DANGEROUS_URL_RE = re.compile("|".join(DANGEROUS_URL_PATTERNS))
+    
+    # Ключевые слова чувствительных полей ввода (в селекторе)
+    _SENSITIVE_FIELD_RE = re.compile(
+        r"password|pass|pwd|secret|card|credit|cvv|cvc|ssn|social|pin",
+        re.IGNORECASE
+    )
     
     # Инструменты и их базовый риск
     TOOL_BASE_RISK = {
@@ -101,6 +121,16 @@ class SecurityLayer:
         self._confirmation_callback = confirmation_callback
         self._skip_confirmations = False
         
+        # Обработчики оценки риска для инструментов, зависящих от контекста
+        self._tool_dispatch: Dict[
+            str, Callable[[Dict[str, Any], Dict[str, Any]], Tuple[str, str]]
+        ] = {
+            "navigate": self._assess_navigate,
+            "click": self._assess_click,
+            "type_text": self._assess_type,
+            "select_option": self._assess_select,
+        }
+        
         logger.info("SecurityLayer инициализирован")
     
     def set_confirmation_callback(
@@ -153,8 +183,8 @@ class SecurityLayer:
         risk_level, risk_reason = self.assess_risk(tool_name, tool_input, page_context)
         
         logger.debug(
-            f"Проверка действия: {action}, "
-            f"tool={tool_name}, risk={risk_level}, reason={risk_reason}"
+            "Проверка действия: %s, tool=%s, risk=%s, reason=%s",
+            action, tool_name, risk_level, risk_reason
         )
         
         # Safe действия проходят без вопросов
@@ -163,6 +193,11 @@ class SecurityLayer:
         
         # Medium и High требуют подтверждения
         if risk_level in ("medium", "high"):
+            # В режиме пропуска подтверждений описание не нужно
+            if self._skip_confirmations:
+                logger.debug("Автоматическое подтверждение (skip mode)")
+                return True, "Подтверждено автоматически (skip mode)"
+            
             # Формируем описание для пользователя
             action_desc = self._format_action_description(
                 action, tool_name, tool_input, page_context
@@ -172,10 +207,10 @@ class SecurityLayer:
             confirmed = await self.request_confirmation(action_desc, risk_reason)
             
             if confirmed:
-                logger.info(f"✓ Действие подтверждено пользователем: {action}")
+                logger.info("✓ Действие подтверждено пользователем: %s", action)
                 return True, "Подтверждено пользователем"
             else:
-                logger.warning(f"✗ Действие отклонено пользователем: {action}")
+                logger.warning("✗ Действие отклонено пользователем: %s", action)
                 return False, "Отклонено пользователем"
         
         # Low risk - разрешаем
@@ -199,77 +234,100 @@ class SecurityLayer:
             Tuple[str, str]: (risk_level, reason)
             risk_level: "safe", "low", "medium", "high"
         """
-        url = page_context.get("url", "")
+        # Инструменты с контекстной проверкой - через таблицу обработчиков
+        handler = self._tool_dispatch.get(tool_name)
+        if handler:
+            return handler(tool_input, page_context)
         
-        # 1. Проверяем navigate на опасные URL
-        if tool_name == "navigate":
-            target_url = tool_input.get("url", "")
-            if self._is_dangerous_url(target_url):
-                return "medium", f"Переход на страницу оплаты/заказа: {target_url}"
-            return "safe", ""
+        # Базовый риск инструмента
+        return self.TOOL_BASE_RISK.get(tool_name, "low"), ""
+    
+    def _assess_navigate(
+        self,
+        tool_input: Dict[str, Any],
+        page_context: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """Проверяет navigate на опасные URL."""
+        target_url = tool_input.get("url", "")
+        if self._is_dangerous_url(target_url):
+            return "medium", f"Переход на страницу оплаты/заказа: {target_url}"
+        return "safe", ""
+    
+    def _assess_click(
+        self,
+        tool_input: Dict[str, Any],
+        page_context: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """Проверяет click по тексту элемента и URL страницы."""
+        # Проверяем текст элемента, если доступен
+        element_text = self._get_element_text(tool_input, page_context)
         
-        # 2. Проверяем click
-        if tool_name == "click":
-            # Проверяем текст элемента, если доступен
-            element_text = self._get_element_text(tool_input, page_context)
-            
-            # Проверяем на опасные паттерны
-            for category, patterns in self.DANGEROUS_PATTERNS.items():
-                if self._matches_patterns(element_text, patterns):
-                    return "high", f"Клик на элемент с опасным действием ({category}): '{element_text}'"
-            
-            # Проверяем контекст URL
-            if self._is_dangerous_url(url):
-                return "medium", f"Клик на странице оплаты/заказа"
-            
-            return "low", ""
+        # Проверяем на опасные паттерны
+        category = self._find_dangerous_category(element_text)
+        if category:
+            return "high", f"Клик на элемент с опасным действием ({category}): '{element_text}'"
         
-        # 3. Проверяем type_text
-        if tool_name == "type_text":
-            text = tool_input.get("text", "")
-            selector = tool_input.get("selector", "")
-            
-            # Проверяем, не вводим ли опасные данные
-            if self._is_sensitive_field(selector, page_context):
-                return "medium", f"Ввод данных в чувствительное поле"
-            
-            # Проверяем содержимое текста
-            for category, patterns in self.DANGEROUS_PATTERNS.items():
-                if category == "personal_data" and self._matches_patterns(text, patterns):
-                    return "medium", f"Ввод чувствительных данных ({category})"
-            
-            return "low", ""
-        
-        # 4. select_option
-        if tool_name == "select_option":
-            value = tool_input.get("value", "")
-            for category, patterns in self.DANGEROUS_PATTERNS.items():
-                if self._matches_patterns(value, patterns):
-                    return "medium", f"Выбор опасной опции ({category}): '{value}'"
-            return "low", ""
-        
-        # 5. Базовый риск инструмента
-        base_risk = self.TOOL_BASE_RISK.get(tool_name, "low")
-        return base_risk, ""
+        # Проверяем контекст URL
+        if self._is_dangerous_url(page_context.get("url", "")):
+            return "medium", f"Клик на странице оплаты/заказа"
+        
+        return "low", ""
+    
+    def _assess_type(
+        self,
+        tool_input: Dict[str, Any],
+        page_context: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """Проверяет type_text по полю ввода и содержимому текста."""
+        text = tool_input.get("text", "")
+        selector = tool_input.get("selector", "")
+        
+        # Проверяем, не вводим ли опасные данные
+        if self._is_sensitive_field(selector, page_context):
+            return "medium", f"Ввод данных в чувствительное поле"
+        
+        # Проверяем содержимое текста
+        if text and self._DANGEROUS_PATTERN_RES["personal_data"].search(text.lower()):
+            return "medium", "Ввод чувствительных данных (personal_data)"
+        
+        return "low", ""
     
-    def _matches_patterns(self, text: str, patterns: list) -> bool:
-        """Проверяет, соответствует ли текст паттернам."""
+    def _assess_select(
+        self,
+        tool_input: Dict[str, Any],
+        page_context: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """Проверяет select_option по выбранному значению."""
+        value = tool_input.get("value", "")
+        category = self._find_dangerous_category(value)
+        if category:
+            return "medium", f"Выбор опасной опции ({category}): '{value}'"
+        return "low", ""
+    
+    def _find_dangerous_category(self, text: Optional[str]) -> Optional[str]:
+        """
+        Возвращает первую категорию DANGEROUS_PATTERNS, найденную в тексте.
+        
+        Текст приводится к нижнему регистру один раз для всех категорий.
+        
+        Args:
+            text: Проверяемый текст
+            
+        Returns:
+            str | None: Категория или None
+        """
         if not text:
-            return False
+            return None
         
         text_lower = text.lower()
-        return any(pattern.lower() in text_lower for pattern in patterns)
+        for category, pattern_re in self._DANGEROUS_PATTERN_RES.items():
+            if pattern_re.search(text_lower):
+                return category
+        return None
     
     def _is_dangerous_url(self, url: str) -> bool:
         """Проверяет, является ли URL потенциально опасным."""
-        if not url:
-            return False
-        
-        url_lower = url.lower()
-        return any(
-            re.search(pattern, url_lower)
-            for pattern in self.DANGEROUS_URL_PATTERNS
-        )
+        return bool(url) and self._DANGEROUS_URL_RE.search(url.lower()) is not None
     
     def _get_element_text(
         self,
@@ -294,17 +352,7 @@ class SecurityLayer:
         page_context: Dict[str, Any]
     ) -> bool:
         """Проверяет, является ли поле чувствительным."""
-        if not selector:
-            return False
-        
-        selector_lower = selector.lower()
-        sensitive_keywords = [
-            "password", "pass", "pwd", "secret",
-            "card", "credit", "cvv", "cvc",
-            "ssn", "social", "pin"
-        ]
-        
-        return any(kw in selector_lower for kw in sensitive_keywords)
+        return bool(selector) and self._SENSITIVE_FIELD_RE.search(selector) is not None
     
     def _format_action_description(
         self,
@@ -365,11 +413,9 @@ class SecurityLayer:
         print("\nРазрешить это действие? (yes/no): ", end="")
         
         try:
-            # Используем asyncio для неблокирующего ввода
-            import asyncio
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, input)
-            return response.lower() in ("yes", "y", "да", "д", "1")
+            # Читаем ввод в отдельном потоке, не блокируя event loop
+            response = await asyncio.to_thread(input)
+            return response.lower() in _CONFIRM_ANSWERS
         except Exception as e:
             logger.error(f"Ошибка при запросе подтверждения: {e}")
             return False
\ No newline at end of file
@@ -8,15 +8,46 @@ URL Validator - проверка безопасности URL.
 - vbscript: - выполнение VBScript
 """
 
+import re
 import logging
-from urllib.parse import urlparse
-from typing import Tuple
+import functools
+from urllib.parse import urlsplit
+from typing import Callable, Tuple
 
 from ..constants import Security
 
 
 logger = logging.getLogger(__name__)
 
+# Схема в начале URL (те же допустимые символы, что и в urlsplit)
+_SCHEME_RE = re.compile(r"\A([A-Za-z][A-Za-z0-9+.\-]*):")
+
+# Вердикты классификации схемы URL
+_SCHEME_ALLOWED = 0
+_SCHEME_BLOCKED = 1
+_SCHEME_UNKNOWN = 2
+
+
+def _is_simple_url(url: str) -> bool:
+    """
+    Проверяет, что URL - ASCII без управляющих символов и скобок (IPv6).
+    
+    Для такого URL схема, найденная _SCHEME_RE, совпадает с urlsplit, и
+    urlsplit не может его отклонить. Остальные URL идут через полный разбор:
+    urlsplit удаляет управляющие символы ("java\nscript:") и проверяет netloc.
+    """
+    return url.isascii() and url.isprintable() and "[" not in url and "]" not in url
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_scheme(url: str) -> str:
+    """
+    Возвращает схему URL в нижнем регистре (с кэшированием).
+    
+    Агент часто возвращается на уже посещённые адреса.
+    """
+    return urlsplit(url).scheme.lower()
+
 
 class URLValidationError(Exception):
     """Ошибка валидации URL."""
@@ -57,10 +88,45 @@ class URLValidator:
             allowed_schemes: Разрешённые схемы (по умолчанию http, https)
             blocked_schemes: Явно запрещённые схемы
             allowed_special: Специальные разрешённые URL (например about:blank)
+            
+        Все наборы хранятся как frozenset в нижнем регистре.
         """
-        self.allowed_schemes = allowed_schemes or Security.ALLOWED_URL_SCHEMES
-        self.blocked_schemes = blocked_schemes or Security.BLOCKED_URL_SCHEMES
-        self.allowed_special = allowed_special or Security.ALLOWED_SPECIAL_URLS
+        # Нормализуем к нижнему регистру: сравнение идёт с url.lower()/схемой
+        # в нижнем регистре, поэтому схемы в другом регистре не сработали бы
+        self.allowed_schemes = frozenset(
+            s.lower() for s in (allowed_schemes or Security.ALLOWED_URL_SCHEMES)
+        )
+        self.blocked_schemes = frozenset(
+            s.lower() for s in (blocked_schemes or Security.BLOCKED_URL_SCHEMES)
+        )
+        self.allowed_special = frozenset(
+            s.lower() for s in (allowed_special or Security.ALLOWED_SPECIAL_URLS)
+        )
+        
+        # Список разрешённых схем для сообщения об ошибке (стабильный порядок)
+        self._allowed_schemes_msg = ", ".join(sorted(self.allowed_schemes))
+        
+        # Специальные URL короткие: длинные URL не приводим к нижнему
+        # регистру только ради проверки about:blank
+        self._max_special_len = max(map(len, self.allowed_special), default=0)
+        
+        # Схема -> вердикт: одна проверка по таблице вместо двух по наборам.
+        # Стоимость поиска не зависит от размера списков (в т.ч. больших
+        # deny-list схем из конфигурации). Запрет имеет приоритет над разрешением
+        self._scheme_verdict: dict[str, int] = dict.fromkeys(
+            self.allowed_schemes, _SCHEME_ALLOWED
+        )
+        self._scheme_verdict.update(dict.fromkeys(self.blocked_schemes, _SCHEME_BLOCKED))
+        
+        # Префиксы быстрого пути: http(s) URL принимаются без полного разбора,
+        # если эти схемы разрешены конфигурацией
+        self._fast_path_prefixes = tuple(
+            f"{scheme}://" for scheme in ("https", "http")
+            if scheme in self.allowed_schemes and scheme not in self.blocked_schemes
+        )
+        
+        # Проверка, специализированная под наборы схем выше
+        self._validate_scheme = self._build_validate_scheme()
     
     def validate(self, url: str) -> bool:
         """
@@ -75,45 +141,103 @@ class URLValidator:
         Raises:
             URLValidationError: Если URL опасен или невалиден
         """
-        if not url:
-            raise URLValidationError("URL не может быть пустым")
+        self._validate_scheme(url)
+        return True
+    
+    def _build_validate_scheme(self) -> Callable[[str], str]:
+        """
+        Строит функцию проверки URL под конфигурацию этого валидатора.
         
-        # Проверяем специальные разрешённые URL
-        url_lower = url.lower().strip()
-        if url_lower in self.allowed_special:
-            logger.debug(f"URL разрешён как специальный: {url}")
-            return True
+        Наборы схем не меняются после __init__, поэтому они захватываются
+        замыканием: проверка каждого URL обходится без обращений к атрибутам
+        self.
         
-        # Парсим URL
-        try:
-            parsed = urlparse(url)
-        except Exception as e:
-            raise URLValidationError(f"Невалидный URL: {url}. Ошибка: {e}")
-        
-        scheme = parsed.scheme.lower()
-        
-        # Проверяем на явно запрещённые схемы
-        if scheme in self.blocked_schemes:
-            logger.warning(f"Заблокирована опасная схема URL: {scheme}:// в {url}")
-            raise URLValidationError(
-                f"Схема URL '{scheme}' запрещена по соображениям безопасности. "
-                f"Используйте http:// или https://"
-            )
-        
-        # Проверяем, что схема в списке разрешённых
-        if scheme and scheme not in self.allowed_schemes:
-            logger.warning(f"Неразрешённая схема URL: {scheme}:// в {url}")
-            raise URLValidationError(
-                f"Схема URL '{scheme}' не разрешена. "
-                f"Разрешённые схемы: {', '.join(self.allowed_schemes)}"
-            )
-        
-        # Если схемы нет - добавляем https по умолчанию (не ошибка)
-        if not scheme:
-            logger.debug(f"URL без схемы, будет добавлен https://: {url}")
+        Returns:
+            Callable[[str], str]: Функция _validate_scheme(url) -> схема
+        """
+        allowed_special = self.allowed_special
+        max_special_len = self._max_special_len
+        scheme_verdict_get = self._scheme_verdict.get
+        fast_path_prefixes = self._fast_path_prefixes
+        allowed_schemes_msg = self._allowed_schemes_msg
         
-        logger.debug(f"URL прошёл валидацию: {url}")
-        return True
+        def _validate_scheme(url: str) -> str:
+            """
+            Проверяет URL и возвращает его схему.
+            
+            Общая часть validate() и sanitize(): sanitize использует схему,
+            не разбирая URL повторно.
+            
+            Args:
+                url: URL для проверки
+                
+            Returns:
+                str: Схема в нижнем регистре ("" если схемы нет)
+                
+            Raises:
+                URLValidationError: Если URL опасен или невалиден
+            """
+            if not url:
+                raise URLValidationError("URL не может быть пустым")
+            
+            # Самый частый случай - URL уже начинается с "https://" или "http://":
+            # принимаем его до strip()/lower() и остальных проверок
+            if url.startswith(fast_path_prefixes) and _is_simple_url(url):
+                return url[:url.find(":")]
+            
+            url_stripped = url.strip()
+            
+            # Проверяем специальные разрешённые URL
+            if (
+                len(url_stripped) <= max_special_len
+                and url_stripped.lower() in allowed_special
+            ):
+                logger.debug("URL разрешён как специальный: %s", url)
+                return _cached_scheme(url_stripped)
+            
+            # Обычно URL уже в нижнем регистре - не копируем строку лишний раз
+            url_lower = url_stripped if url_stripped.islower() else url_stripped.lower()
+            
+            if _is_simple_url(url_lower):
+                # Быстрый путь для http(s) в другом регистре или с пробелами
+                if url_lower.startswith(fast_path_prefixes):
+                    return url_lower[:url_lower.find(":")]
+                
+                match = _SCHEME_RE.match(url_lower)
+                scheme = match.group(1) if match else ""
+            else:
+                # Парсим URL (уже без пробельных символов по краям, как в sanitize)
+                try:
+                    scheme = _cached_scheme(url_stripped)
+                except Exception as e:
+                    raise URLValidationError(f"Невалидный URL: {url}. Ошибка: {e}")
+            
+            verdict = scheme_verdict_get(scheme, _SCHEME_UNKNOWN)
+            
+            # Проверяем на явно запрещённые схемы
+            if verdict == _SCHEME_BLOCKED:
+                logger.warning("Заблокирована опасная схема URL: %s:// в %s", scheme, url)
+                raise URLValidationError(
+                    f"Схема URL '{scheme}' запрещена по соображениям безопасности. "
+                    f"Используйте http:// или https://"
+                )
+            
+            # Проверяем, что схема в списке разрешённых
+            if verdict == _SCHEME_UNKNOWN and scheme:
+                logger.warning("Неразрешённая схема URL: %s:// в %s", scheme, url)
+                raise URLValidationError(
+                    f"Схема URL '{scheme}' не разрешена. "
+                    f"Разрешённые схемы: {allowed_schemes_msg}"
+                )
+            
+            # Если схемы нет - добавляем https по умолчанию (не ошибка)
+            if not scheme:
+                logger.debug("URL без схемы, будет добавлен https://: %s", url)
+            
+            logger.debug("URL прошёл валидацию: %s", url)
+            return scheme
+        
+        return _validate_scheme
     
     def is_safe(self, url: str) -> Tuple[bool, str]:
         """
@@ -144,21 +268,21 @@ class URLValidator:
         Raises:
             URLValidationError: Если URL опасен
         """
-        # Сначала валидируем
-        self.validate(url)
+        # Валидируем и получаем схему
+        scheme = self._validate_scheme(url)
         
         # Добавляем схему если отсутствует
         url_stripped = url.strip()
-        parsed = urlparse(url_stripped)
-        
-        if not parsed.scheme:
+        if not scheme:
             return f"https://{url_stripped}"
         
         return url_stripped
 
 
-# Глобальный экземпляр для удобства использования
-_default_validator: URLValidator | None = None
+# Глобальный экземпляр для удобства использования. Создаётся при импорте:
+# он дешёвый и не меняется после __init__, а ленивая инициализация без
+# блокировки могла создать два экземпляра при вызове из разных потоков
+_default_validator: URLValidator = URLValidator()
 
 
 def get_url_validator() -> URLValidator:
@@ -168,9 +292,6 @@ def get_url_validator() -> URLValidator:
     Returns:
         URLValidator: Глобальный валидатор
     """
-    global _default_validator
-    if _default_validator is None:
-        _default_validator = URLValidator()
     return _default_validator
 
 
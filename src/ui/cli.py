@@ -7,9 +7,10 @@ CLI - командный интерфейс для Browser Agent.
 
 import asyncio
 import logging
+import re
 import time
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 
 from rich.console import Console
 from rich.panel import Panel
@@ -31,6 +32,113 @@ logger = logging.getLogger(__name__)
 # Версия приложения
 VERSION = "1.0.0"
 
+# Приглашение к вводу и прощание в главном цикле
+_PROMPT = "\n[bold cyan]Введите задачу[/bold cyan]"
+_GOODBYE = "[dim]До свидания! 👋[/dim]"
+
+# Баннер при запуске
+_BANNER = """
+╔══════════════════════════════════════════════════════════════╗
+║                                                              ║
+║          🌐  [bold cyan]Browser Agent[/bold cyan] v{version}                       ║
+║                                                              ║
+║      [dim]AI-агент для автоматизации браузера[/dim]                 ║
+║      [dim]Powered by Claude AI & Playwright[/dim]                   ║
+║                                                              ║
+╚══════════════════════════════════════════════════════════════╝
+""".format(version=VERSION)
+
+
+def _build_help_table() -> Table:
+    """Строит таблицу справки по командам."""
+    help_table = Table(
+        title="📖 Справка по командам",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold cyan"
+    )
+    
+    help_table.add_column("Команда", style="cyan", width=20)
+    help_table.add_column("Описание", style="white")
+    
+    help_table.add_row("help", "Показать эту справку")
+    help_table.add_row("exit / quit / выход", "Выйти из программы")
+    help_table.add_row("status", "Показать текущий статус")
+    help_table.add_row("stop", "Остановить текущую задачу")
+    help_table.add_row("[текст задачи]", "Выполнить задачу")
+    
+    return help_table
+
+
+# Статичные элементы справки строятся один раз при импорте
+_HELP_TABLE = _build_help_table()
+
+_EXAMPLES_PANEL = Panel(
+    "[bold]Примеры задач:[/bold]\n\n"
+    "• Перейди на google.com и найди погоду в Москве\n"
+    "• Открой hh.ru и найди вакансии Python разработчика\n"
+    "• Зайди на wikipedia.org и найди информацию о Python\n"
+    "• Перейди на github.com и найди репозиторий playwright",
+    title="💡 Примеры",
+    border_style="green"
+)
+
+
+def _plain_markup(markup: str) -> str:
+    """Убирает rich-разметку для вывода в неинтерактивный поток."""
+    return Text.from_markup(markup).plain
+
+
+# Символы UI (box-drawing), которые попадают во ввод при копировании
+# из консоли. На кириллическом вводе regex заметно быстрее str.translate
+_UI_RE = re.compile('[═║╔╗╚╝─│┌┐└┘├┤┬┴┼▀▄█▌▐░▒▓■□▪▫]')
+
+# Команды CLI: ввод в нижнем регистре -> команда
+_COMMANDS: Dict[str, str] = {
+    "exit": "exit",
+    "quit": "exit",
+    "выход": "exit",
+    "q": "exit",
+    "help": "help",
+    "status": "status",
+    "stop": "stop",
+}
+
+
+def _format_click(params: Dict[str, Any]) -> str:
+    """Форматирует click для вывода."""
+    selector = params.get("selector", "")
+    element_idx = params.get("element_index", "")
+    target = selector or f"элемент #{element_idx}"
+    return f"[bold]Клик[/bold] на {target}"
+
+
+def _format_type_text(params: Dict[str, Any]) -> str:
+    """Форматирует type_text для вывода."""
+    text = params.get("text", "")
+    preview = text[:30] + "..." if len(text) > 30 else text
+    return f"[bold]Ввод текста:[/bold] \"{preview}\""
+
+
+def _format_wait(params: Dict[str, Any]) -> str:
+    """Форматирует wait для вывода."""
+    selector = params.get("selector")
+    if selector:
+        return f"[bold]Ожидание[/bold] элемента {selector}"
+    return f"[bold]Пауза[/bold] {params.get('timeout', 0)}ms"
+
+
+# Форматтеры действий агента для вывода в консоль
+_ACTION_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "navigate": lambda p: f"[bold]Переход на[/bold] {p.get('url', '')}",
+    "click": _format_click,
+    "type_text": _format_type_text,
+    "scroll": lambda p: f"[bold]Прокрутка[/bold] {p.get('direction', 'down')}",
+    "wait": _format_wait,
+    "extract_data": lambda p: f"[bold]Извлечение данных:[/bold] {p.get('query', '')}",
+    "complete_task": lambda p: "[bold green]Завершение задачи[/bold green]",
+}
+
 
 class CLI:
     """
@@ -68,6 +176,8 @@ class CLI:
                 os.system('chcp 65001 >nul 2>&1')
         
         self.console = Console()
+        # Вывод перенаправлен (CI, лог-файл) - печатаем без rich
+        self._is_tty = self.console.is_terminal
         self._api_key = api_key
         self._agent: Optional[BrowserAgent] = None
         self._security: Optional[SecurityLayer] = None
@@ -78,55 +188,19 @@ class CLI:
         
     def _print_banner(self) -> None:
         """Выводит красивый ASCII баннер при запуске."""
-        banner = """
-╔══════════════════════════════════════════════════════════════╗
-║                                                              ║
-║          🌐  [bold cyan]Browser Agent[/bold cyan] v{version}                       ║
-║                                                              ║
-║      [dim]AI-агент для автоматизации браузера[/dim]                 ║
-║      [dim]Powered by Claude AI & Playwright[/dim]                   ║
-║                                                              ║
-╚══════════════════════════════════════════════════════════════╝
-""".format(version=VERSION)
-        
-        self.console.print(banner)
+        self.console.print(_BANNER)
         self.console.print(
             "[dim]Введите задачу для выполнения или 'help' для справки[/dim]\n"
         )
     
     def _print_help(self) -> None:
         """Выводит справку по командам."""
-        help_table = Table(
-            title="📖 Справка по командам",
-            box=box.ROUNDED,
-            show_header=True,
-            header_style="bold cyan"
-        )
-        
-        help_table.add_column("Команда", style="cyan", width=20)
-        help_table.add_column("Описание", style="white")
-        
-        help_table.add_row("help", "Показать эту справку")
-        help_table.add_row("exit / quit / выход", "Выйти из программы")
-        help_table.add_row("status", "Показать текущий статус")
-        help_table.add_row("stop", "Остановить текущую задачу")
-        help_table.add_row("[текст задачи]", "Выполнить задачу")
-        
         self.console.print()
-        self.console.print(help_table)
+        self.console.print(_HELP_TABLE)
         self.console.print()
         
         # Примеры задач
-        examples = Panel(
-            "[bold]Примеры задач:[/bold]\n\n"
-            "• Перейди на google.com и найди погоду в Москве\n"
-            "• Открой hh.ru и найди вакансии Python разработчика\n"
-            "• Зайди на wikipedia.org и найди информацию о Python\n"
-            "• Перейди на github.com и найди репозиторий playwright",
-            title="💡 Примеры",
-            border_style="green"
-        )
-        self.console.print(examples)
+        self.console.print(_EXAMPLES_PANEL)
     
     def _print_status(self) -> None:
         """Выводит текущий статус агента."""
@@ -200,51 +274,27 @@ class CLI:
         
         # Форматируем вывод
         action_text = self._format_action(action, params)
+        if not self._is_tty:
+            print("● " + _plain_markup(action_text))
+            return
         self.console.print(f"[cyan]●[/cyan] {action_text}")
     
     async def _on_status(self, status: str) -> None:
         """Callback при изменении статуса."""
+        if not self._is_tty:
+            print("→ " + _plain_markup(status))
+            return
         self.console.print(f"[dim]→ {status}[/dim]")
     
     def _format_action(self, action: str, params: Dict[str, Any]) -> str:
         """Форматирует действие для вывода."""
-        match action:
-            case "navigate":
-                url = params.get("url", "")
-                self._current_url = url
-                return f"[bold]Переход на[/bold] {url}"
-            
-            case "click":
-                selector = params.get("selector", "")
-                element_idx = params.get("element_index", "")
-                target = selector or f"элемент #{element_idx}"
-                return f"[bold]Клик[/bold] на {target}"
-            
-            case "type_text":
-                text = params.get("text", "")
-                preview = text[:30] + "..." if len(text) > 30 else text
-                return f"[bold]Ввод текста:[/bold] \"{preview}\""
-            
-            case "scroll":
-                direction = params.get("direction", "down")
-                return f"[bold]Прокрутка[/bold] {direction}"
-            
-            case "wait":
-                timeout = params.get("timeout", 0)
-                selector = params.get("selector")
-                if selector:
-                    return f"[bold]Ожидание[/bold] элемента {selector}"
-                return f"[bold]Пауза[/bold] {timeout}ms"
-            
-            case "extract_data":
-                query = params.get("query", "")
-                return f"[bold]Извлечение данных:[/bold] {query}"
-            
-            case "complete_task":
-                return "[bold green]Завершение задачи[/bold green]"
-            
-            case _:
-                return f"[bold]{action}[/bold]: {params}"
+        if action == "navigate":
+            self._current_url = params.get("url", "")
+        
+        formatter = _ACTION_FORMATTERS.get(action)
+        if formatter:
+            return formatter(params)
+        return f"[bold]{action}[/bold]: {params}"
     
     def _print_result(self, result: TaskResult, elapsed_time: float) -> None:
         """Выводит итоговый результат выполнения задачи."""
@@ -372,47 +422,45 @@ class CLI:
         """
         self._print_banner()
         
+        console_print = self.console.print
+        prompt_ask = Prompt.ask
+        
         try:
             while True:
                 try:
                     # Получаем ввод от пользователя
-                    task = Prompt.ask("\n[bold cyan]Введите задачу[/bold cyan]")
+                    task = prompt_ask(_PROMPT)
                     task = task.strip()
                     
                     # Проверяем на пустой ввод
                     if not task:
                         continue
                     
-                    # Фильтруем UI элементы и бессмысленный ввод
-                    # Проверяем наличие специальных символов UI (box-drawing characters)
-                    ui_chars = set('═║╔╗╚╝─│┌┐└┘├┤┬┴┼▀▄█▌▐░▒▓■□▪▫')
-                    if all(c in ui_chars or c.isspace() for c in task):
-                        continue
-                    
-                    # Проверяем минимальную осмысленную длину
-                    # Убираем все UI символы и проверяем что осталось
-                    meaningful_task = ''.join(c for c in task if c not in ui_chars)
-                    meaningful_task = meaningful_task.strip()
+                    # Фильтруем UI элементы и бессмысленный ввод:
+                    # убираем все UI символы (box-drawing characters) и
+                    # проверяем минимальную осмысленную длину. Ввод только
+                    # из UI символов и пробелов даёт пустую строку
+                    meaningful_task = _UI_RE.sub('', task).strip()
                     
                     if len(meaningful_task) < 3:
                         continue
                     
                     # Обрабатываем команды
-                    task_lower = task.lower()
+                    command = _COMMANDS.get(task.lower())
                     
-                    if task_lower in ("exit", "quit", "выход", "q"):
-                        self.console.print("[dim]До свидания! 👋[/dim]")
+                    if command == "exit":
+                        console_print(_GOODBYE)
                         break
                     
-                    if task_lower == "help":
+                    if command == "help":
                         self._print_help()
                         continue
                     
-                    if task_lower == "status":
+                    if command == "status":
                         self._print_status()
                         continue
                     
-                    if task_lower == "stop":
+                    if command == "stop":
                         await self._stop_task()
                         continue
                     
@@ -423,7 +471,7 @@ class CLI:
                     await self._current_task
                     
                 except KeyboardInterrupt:
-                    self.console.print("\n[yellow]Прервано пользователем[/yellow]")
+                    console_print("\n[yellow]Прервано пользователем[/yellow]")
                     continue
                 except asyncio.CancelledError:
                     continue
@@ -0,0 +1 @@
+"""Shared helpers for the task test scripts in the project root."""
@@ -0,0 +1,195 @@
+"""
+Result cache for the task test scripts.
+
+During development the same task is rerun many times and every rerun goes
+through all the LLM calls again. CachedAgent stores a task's result on disk
+and returns it when the same task text comes up again, without touching
+the agent or the browser.
+
+The cache is enabled with AGENT_CACHE=1 and is off otherwise.
+"""
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.core.agent import BrowserAgent
+from src.core.task_manager import TaskResult, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Cache directory and the maximum number of stored results
+_DEFAULT_CACHE_DIR = Path(".cache") / "agent_runs"
+_DEFAULT_MAX_ENTRIES = 64
+
+
+def _normalize_task(task: str) -> str:
+    """Normalize task text for comparison (case and whitespace)."""
+    return " ".join(task.casefold().split())
+
+
+def _result_to_dict(result: TaskResult) -> Dict[str, Any]:
+    """Serialize a TaskResult to a JSON-compatible dict."""
+    return {
+        "success": result.success,
+        "summary": result.summary,
+        "status": result.status.value,
+        "data": result.data,
+        "error": result.error,
+        "actions_count": result.actions_count,
+        "duration_seconds": result.duration_seconds,
+    }
+
+
+def _result_from_dict(data: Dict[str, Any]) -> TaskResult:
+    """Restore a TaskResult from a dict."""
+    return TaskResult(
+        success=data["success"],
+        summary=data["summary"],
+        status=TaskStatus(data["status"]),
+        data=data.get("data"),
+        error=data.get("error"),
+        actions_count=data.get("actions_count", 0),
+        duration_seconds=data.get("duration_seconds", 0.0),
+    )
+
+
+def is_cache_enabled() -> bool:
+    """Check whether the cache is enabled (AGENT_CACHE=1)."""
+    return os.getenv("AGENT_CACHE", "0") == "1"
+
+
+class CachedAgent:
+    """
+    BrowserAgent wrapper with a task result cache.
+
+    The cache key is the task text ignoring case and extra whitespace.
+    Only successful results are stored; the oldest entries are evicted
+    (LRU) once there are more than max_entries.
+
+    The agent may be set after construction, so a cache hit can be checked
+    before any agent is created (see run_task in _harness.py).
+    """
+
+    def __init__(
+        self,
+        agent: Optional[BrowserAgent] = None,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        enabled: Optional[bool] = None,
+    ):
+        """
+        Args:
+            agent: Agent that runs tasks on a cache miss (required by run())
+            cache_dir: Directory for cache files (default .cache/agent_runs)
+            max_entries: Maximum number of stored results
+            enabled: Enable the cache (default from AGENT_CACHE)
+        """
+        self.agent = agent
+        self.cache_dir = cache_dir or _DEFAULT_CACHE_DIR
+        self.max_entries = max_entries
+        self.enabled = is_cache_enabled() if enabled is None else enabled
+
+        # Key -> file path, oldest first
+        self._index: "OrderedDict[str, Path]" = OrderedDict()
+        if self.enabled:
+            self._load_index()
+
+    def _load_index(self) -> None:
+        """Load the cache entries from disk, ordered by modification time."""
+        if not self.cache_dir.is_dir():
+            return
+
+        files = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            self._index[path.stem] = path
+
+    def _key(self, task: str) -> str:
+        """Return the cache key for a task."""
+        return hashlib.sha256(_normalize_task(task).encode("utf-8")).hexdigest()
+
+    def _get(self, key: str) -> Optional[TaskResult]:
+        """Return the cached result or None."""
+        path = self._index.get(key)
+        if path is None:
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = _result_from_dict(json.load(f)["result"])
+            # Touch the file so the LRU order survives a restart
+            os.utime(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Broken cache entry %s: %s", path, e)
+            self._index.pop(key, None)
+            return None
+
+        self._index.move_to_end(key)
+        return result
+
+    def _put(self, key: str, task: str, result: TaskResult) -> None:
+        """Store a result and evict the oldest entries."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"task": task, "result": _result_to_dict(result)},
+                f,
+                ensure_ascii=False,
+                indent=2
+            )
+
+        self._index[key] = path
+        self._index.move_to_end(key)
+
+        while len(self._index) > self.max_entries:
+            _, old_path = self._index.popitem(last=False)
+            try:
+                old_path.unlink()
+            except OSError:
+                pass
+
+    def get(self, task: str) -> Optional[TaskResult]:
+        """
+        Return the stored result of a task without running the agent.
+
+        Returns:
+            Cached result, or None on a miss or when the cache is disabled
+        """
+        if not self.enabled:
+            return None
+        return self._get(self._key(task))
+
+    async def run(
+        self,
+        task: str,
+        user_response_callback: Optional[Callable[[str], Awaitable[str]]] = None
+    ) -> TaskResult:
+        """
+        Run the task or return its stored result.
+
+        Args:
+            task: Task text
+            user_response_callback: Passed to BrowserAgent.run()
+
+        Returns:
+            Task result (possibly from the cache)
+        """
+        if not self.enabled:
+            return await self.agent.run(task, user_response_callback)
+
+        key = self._key(task)
+        cached = self._get(key)
+        if cached is not None:
+            logger.info("Task result taken from cache: %s", key[:12])
+            return cached
+
+        result = await self.agent.run(task, user_response_callback)
+        if result.success:
+            self._put(key, task, result)
+
+        return result
@@ -0,0 +1,151 @@
+"""
+Agent callbacks shared by the task test scripts.
+
+on_action/on_status are plain top-level coroutines; confirm_action differs
+per script only in its keyword lists, so it is built by a factory.
+"""
+import asyncio
+import atexit
+import logging
+import logging.handlers
+import queue
+import re
+import sys
+from typing import Awaitable, Callable, Iterable, Optional, Pattern
+
+ConfirmCallback = Callable[[str, str], Awaitable[bool]]
+
+# Answers that approve an action
+_YES_ANSWERS = frozenset(('y', 'yes', 'д', 'да'))
+
+
+# Listener writing progress lines to the console; started on first use
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _progress_logger() -> logging.Logger:
+    """
+    Logger for on_action/on_status output.
+
+    Records go through a queue to a listener thread that writes them to the
+    console, so the agent's event loop does not wait on stdout per action.
+    The listener is started lazily, on the first progress line.
+    """
+    global _listener
+
+    progress_logger = logging.getLogger("tests.progress")
+    if _listener is not None:
+        return progress_logger
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    # Flush what is left in the queue when the script exits
+    atexit.register(_listener.stop)
+
+    progress_logger.setLevel(logging.INFO)
+    progress_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    # Keep progress lines out of the application's root handlers
+    progress_logger.propagate = False
+    return progress_logger
+
+
+def flush_progress() -> None:
+    """
+    Write out all queued progress lines.
+
+    Call before printing directly or asking for input, so the output is not
+    interleaved with progress lines still waiting in the queue.
+    """
+    if _listener is None:
+        return
+    # stop() drains the queue and joins the thread; start a fresh one after
+    _listener.stop()
+    _listener.start()
+
+
+def _keyword_re(keywords: Iterable[str]) -> Optional[Pattern[str]]:
+    """Compile keywords into one case-insensitive alternation (None if empty)."""
+    keywords = list(keywords)
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+def make_confirm_action(
+    auto_keywords: Iterable[str] = (),
+    confirm_keywords: Iterable[str] = (),
+    *,
+    auto_reason_keywords: Iterable[str] = (),
+    ask_by_default: bool = False,
+    prompt: str = "   Разрешить? (y/n): ",
+    warning: Optional[str] = None,
+) -> ConfirmCallback:
+    """
+    Build a confirmation callback for SecurityLayer.
+
+    Args:
+        auto_keywords: Action substrings that are approved without asking
+        confirm_keywords: Reason substrings that require asking the user
+        auto_reason_keywords: Reason substrings that are approved without asking
+        ask_by_default: Ask the user when no keyword matched
+        prompt: Question shown when asking the user
+        warning: Extra line printed before asking
+
+    Returns:
+        Async callback (action, reason) -> bool
+    """
+    # Each keyword list is matched by one precompiled regex
+    auto_re = _keyword_re(auto_keywords)
+    confirm_re = _keyword_re(confirm_keywords)
+    auto_reason_re = _keyword_re(auto_reason_keywords)
+
+    async def confirm_action(action: str, reason: str) -> bool:
+        flush_progress()
+        print(f"\n⚠️  Security Check:")
+        print(f"   Action: {action}")
+        print(f"   Reason: {reason}")
+
+        # Auto-approve safe actions (navigation, reading)
+        if (auto_re and auto_re.search(action)) or (
+            auto_reason_re and auto_reason_re.search(reason)
+        ):
+            print(f"   ✓ Auto-approved (safe action)\n")
+            return True
+
+        # Ask for confirmation on risky actions
+        if ask_by_default or (confirm_re and confirm_re.search(reason)):
+            if warning:
+                print(f"   ⚠️  {warning}")
+            response = await asyncio.to_thread(input, prompt)
+            return response.casefold() in _YES_ANSWERS
+
+        # Default: auto-approve other actions
+        print(f"   ✓ Auto-approved\n")
+        return True
+
+    return confirm_action
+
+
+async def on_action(action: str, params: dict):
+    """Log an agent action with its main parameter."""
+    progress = _progress_logger()
+    progress.info("🔵 Action: %s", action)
+    if action == "navigate":
+        progress.info("   → URL: %s", params.get('url', 'N/A'))
+    elif action == "click":
+        progress.info("   → Target: %s", params.get('selector', params.get('element_index', 'N/A')))
+    elif action == "type_text":
+        text = params.get('text', '')
+        preview = text[:30] + "..." if len(text) > 30 else text
+        progress.info("   → Text: %s", preview)
+    elif action == "extract_data":
+        progress.info("   → Query: %s", params.get('query', 'N/A'))
+
+
+async def on_status(status: str):
+    """Log an agent status update."""
+    _progress_logger().info("📝 Status: %s", status)
@@ -0,0 +1,160 @@
+"""
+Shared runner for the task test scripts.
+
+Each script only defines its task, notes and confirmation rules;
+run_task() handles agent setup, result printing and shutdown. Passing an
+already started agent lets several tasks share one browser (see run_all.py).
+"""
+import asyncio
+import traceback
+from typing import Optional, Sequence
+
+from src.core.agent import BrowserAgent
+from src.core.task_manager import TaskResult
+from src.security.security_layer import SecurityLayer
+from tests._cached_agent import CachedAgent
+from tests._callbacks import ConfirmCallback, flush_progress, on_action, on_status
+
+# Width of the separator lines
+_WIDTH = 70
+
+
+def create_agent(confirm_action: ConfirmCallback) -> BrowserAgent:
+    """Create an agent with the shared progress callbacks."""
+    security = SecurityLayer(confirmation_callback=confirm_action)
+    return BrowserAgent(
+        on_action=on_action,
+        on_status=on_status,
+        security_layer=security
+    )
+
+
+def _print_task_header(task_title: str) -> None:
+    """Print the task being run."""
+    print("\n" + "=" * _WIDTH)
+    print(f"TASK: {task_title}")
+    print("=" * _WIDTH + "\n")
+
+
+def _print_result(
+    agent: Optional[BrowserAgent], result: TaskResult, data_title: str
+) -> None:
+    """Print the task result, token usage (if an agent ran it) and extracted data."""
+    print("\n" + "=" * _WIDTH)
+    print("RESULT")
+    print("=" * _WIDTH)
+    print(f"Status: {result.status.value}")
+    print(f"\nSummary: {result.summary}")
+    print(f"\nActions performed: {result.actions_count}")
+
+    # Token usage statistics
+    token_stats = agent.get_token_stats() if agent is not None else None
+    if token_stats and token_stats["total_tokens"] > 0:
+        print(f"\n💰 Token Usage:")
+        print(f"   Input:  {token_stats['input_tokens']:,} tokens")
+        print(f"   Output: {token_stats['output_tokens']:,} tokens")
+        print(f"   Total:  {token_stats['total_tokens']:,} tokens")
+        print(f"   Estimated Cost: ${token_stats['estimated_cost']:.4f}")
+
+    if result.data:
+        print(f"\n{'=' * _WIDTH}")
+        print(data_title)
+        print('=' * _WIDTH)
+        print(result.data)
+        print('=' * _WIDTH)
+
+    if result.error:
+        print(f"\n❌ Error: {result.error}")
+
+    print()
+
+
+async def run_task(
+    task: str,
+    *,
+    title: str,
+    task_title: str,
+    confirm_action: ConfirmCallback,
+    notes: Sequence[str] = (),
+    data_title: str = "EXTRACTED DATA:",
+    agent: Optional[BrowserAgent] = None,
+    wait_for_enter: bool = True,
+) -> Optional[TaskResult]:
+    """
+    Run one task test.
+
+    Args:
+        task: Task text for the agent
+        title: Test header
+        task_title: Short task description printed before the run
+        confirm_action: Confirmation callback for this task
+        notes: Lines printed before the run (login hints etc.)
+        data_title: Header for the extracted data
+        agent: Started agent to reuse; if None, one is created, started
+               and stopped here (not created at all on a cache hit)
+        wait_for_enter: Keep the browser open until Enter is pressed
+                        (only for an agent created here)
+
+    Returns:
+        Task result, or None if the run failed with an exception
+    """
+    print("=" * _WIDTH)
+    print(title)
+    print("=" * _WIDTH)
+    print()
+
+    # AGENT_CACHE=1 reuses results of previous runs of the same task
+    cached_agent = CachedAgent(agent)
+
+    # Cache hit: show the stored result without creating an agent
+    result = cached_agent.get(task)
+    if result is not None:
+        _print_task_header(task_title)
+        print("♻️  Result loaded from cache (AGENT_CACHE=1), browser not started")
+        _print_result(None, result, data_title)
+        return result
+
+    owns_agent = agent is None
+    if owns_agent:
+        print("Initializing agent...")
+        agent = create_agent(confirm_action)
+        cached_agent.agent = agent
+    elif agent.security_layer is not None:
+        # Shared agent: apply this task's confirmation rules
+        agent.security_layer = SecurityLayer(confirmation_callback=confirm_action)
+
+    try:
+        if owns_agent:
+            print("Starting browser...")
+            await agent.start()
+
+        _print_task_header(task_title)
+
+        if notes:
+            for line in notes:
+                print(line)
+            print()
+
+        result = await cached_agent.run(task)
+        flush_progress()
+        _print_result(agent, result, data_title)
+
+    except KeyboardInterrupt:
+        flush_progress()
+        print("\n\n⚠️  Interrupted by user")
+    except Exception as e:
+        flush_progress()
+        print(f"\n❌ Error: {e}")
+        traceback.print_exc()
+    finally:
+        if owns_agent:
+            flush_progress()
+            if wait_for_enter:
+                # Wait for Enter in a thread so the event loop keeps serving the browser
+                await asyncio.to_thread(input, "\nPress Enter to close browser and exit...")
+            print("Closing browser...")
+            await agent.stop()
+            flush_progress()
+            print("✅ Test completed!")
+
+    return result
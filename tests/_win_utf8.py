@@ -0,0 +1,16 @@
+"""
+UTF-8 console setup for Windows, shared by the test scripts.
+
+Importing this module applies the setup; Python caches the module, so
+the console is reconfigured once per process no matter how many test
+scripts import it.
+"""
+import sys
+
+# Set UTF-8 encoding for Windows
+if sys.platform == "win32":
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except (AttributeError, TypeError):
+        import os
+        os.system('chcp 65001 >nul 2>&1')
@@ -0,0 +1,45 @@
+"""
+Run the task test scripts back to back in one process.
+
+One agent and one browser are shared by all tasks, so Playwright import,
+browser startup and logins happen once instead of once per script.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+# Set UTF-8 encoding for Windows
+from tests import _win_utf8  # noqa: F401
+
+from tests._callbacks import make_confirm_action
+from tests._harness import create_agent
+from test_food_order import test_food_order
+from test_gmail_task import test_gmail
+from test_job_search import test_job_search
+
+
+async def run_all():
+    """Run all task tests with one shared browser."""
+    # Each task installs its own confirmation rules before running
+    agent = create_agent(make_confirm_action(ask_by_default=True))
+
+    try:
+        print("Starting browser...")
+        await agent.start()
+
+        for test in (test_food_order, test_gmail, test_job_search):
+            await test(agent)
+    finally:
+        # Wait for Enter in a thread so the event loop keeps serving the browser
+        await asyncio.to_thread(input, "\nPress Enter to close browser and exit...")
+        print("Closing browser...")
+        await agent.stop()
+        print("✅ All tests completed!")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_all())